@@ -13,7 +13,6 @@ from pathlib import Path
 
 from loguru import logger
 
-from check_pyproject.check_pyproject_toml import validate_pyproject_toml_file
 from check_pyproject.settings import Settings
 
 
@@ -25,6 +24,11 @@ def main(args: list[str] | None = None) -> int:
         # after completion.  The quick_exit flag indicates if this is the case.
         if settings.quick_exit:
             return 0
+
+        # deferred so --help, --version, and --longhelp do not pay for importing the checker
+        # and its packaging dependencies.
+        from check_pyproject.check_pyproject_toml import validate_pyproject_toml_file
+
         # process each pyproject.toml file passed on the commandline.
         for arg in settings.pyproject_toml_files:
             logger.info(f'Checking: "{arg}"')
@@ -27,20 +27,11 @@ from check_pyproject.poetry_requirement import (
 if TYPE_CHECKING:
     from collections.abc import Callable
 
-# valid dependency markers
-valid_markers_set = {
-    "os_name",  # posix, java
-    "sys_platform",  # linux, linux2, darwin, java1.8.0_51
-    "platform_machine",  # x86_64
-    "platform_python_implementation",  # CPython, Jython
-    "platform_release",  # 3.14.1-x86_64-linode39, 14.5.0, 1.8.0_51
-    "platform_system",  # Linux, Windows, Java
-    "platform_version",  # #1 SMP Fri Apr 25 13:07:35 EDT 2014 Java HotSpot(TM) 64-Bit Server VM, ...
-    "python_version",  # 3.4, 2.7
-    "python_full_version",  # 3.4.0, 3.5.0b1
-    "implementation_name",  # cpython
-    "implementation_version",  # 3.4.0, 3.5.0b1
-}
+# VCS url prefixes to convert into pip's "vcs+https://" url scheme
+_GIT_PREFIX_RE = re.compile(r"^(git@|https://)")
+_HG_PREFIX_RE = re.compile(r"^(hg@|https://)")
+_SVN_PREFIX_RE = re.compile(r"^(svn@|https://)")
+_BZR_PREFIX_RE = re.compile(r"^(bzr@|https://)")
 
 
 def string_field(value: str) -> str:
@@ -93,6 +84,9 @@ def check_fields(
             if field in poetry_data:
                 # in both
                 logger.info(f'"{field}" found in both [project] and [tool.poetry]')
+                if project_data[field] == poetry_data[field]:
+                    # identical raw values convert to identical values, so skip the callbacks
+                    continue
                 project_out = callback(project_data[field])
                 poetry_out = callback(poetry_data[field])
                 if project_out != poetry_out:
@@ -124,11 +118,12 @@ def format_diff_values(
     Format the differences between project and poetry values, but not dependencies.
     """
 
+    def quoted_list(values: set[str]) -> str:
+        # ex: ["a", "b"], or [] when empty
+        return "[" + ", ".join(f'"{value}"' for value in sorted(values)) + "]"
+
     def set_vs_set(aa: set[str], bb: set[str]) -> str:
-        aa_str = pformat(sorted(aa))
-        bb_str = pformat(sorted(bb))
-        # format the "a vs b" then replace any "set()" with "{ }" and replace single quotes with double quotes
-        return f"project: {aa_str}\nvs\npoetry: {bb_str}".replace("set()", "{ }").replace("'", '"')
+        return f"project: {quoted_list(aa)}\nvs\npoetry: {quoted_list(bb)}"
 
     if isinstance(project_data, str) and isinstance(poetry_data, str):
         return f'"{project_data}"\nvs.\n"{poetry_data}"'
@@ -137,9 +132,9 @@ def format_diff_values(
         b = {key + "=" + poetry_data[key] for key in poetry_data}
         return set_vs_set(a.difference(b), b.difference(a))
     if isinstance(project_data, list) and isinstance(poetry_data, list):
-        a = set(project_data).difference(set(poetry_data))
-        b = set(poetry_data).difference(set(project_data))
-        return set_vs_set(a, b)
+        a = set(project_data)
+        b = set(poetry_data)
+        return set_vs_set(a.difference(b), b.difference(a))
     if isinstance(project_data, set) and isinstance(poetry_data, set):
         a = {str(data) for data in project_data}
         b = {str(data) for data in poetry_data}
@@ -206,7 +201,7 @@ def build_git_url(package_name: str, package_value: dict[str, str], value: str)
 
     ref: https://pip.pypa.io/en/stable/topics/vcs-support/#git
     """
-    value = re.sub(r"^(git@|https://)", r"git+https://", value)
+    value = _GIT_PREFIX_RE.sub(r"git+https://", value)
     url = f"{package_name}@ {value}"
     if "rev" in package_value:
         url = f"{url}@{package_value['rev']}"
@@ -228,7 +223,7 @@ def build_hg_url(package_name: str, package_value: dict[str, str], value: str) -
         MyProject @ hg+http://hg.example.com/MyProject@special_feature
     ref: https://pip.pypa.io/en/stable/topics/vcs-support/#mercurial
     """
-    value = re.sub(r"^(hg@|https://)", r"hg+https://", value)
+    value = _HG_PREFIX_RE.sub(r"hg+https://", value)
     url = f"{package_name}@ {value}"
     if "rev" in package_value:
         url = f"{url}@{package_value['rev']}"
@@ -249,7 +244,7 @@ def build_svn_url(package_name: str, package_value: dict[str, str], value: str)
         -e svn+http://svn.example.com/svn/MyProject/trunk@{20080101}#egg=MyProject
     ref: https://pip.pypa.io/en/stable/topics/vcs-support/#subversion
     """
-    url = re.sub(r"^(svn@|https://)", r"svn+https://", value)
+    url = _SVN_PREFIX_RE.sub(r"svn+https://", value)
     if "rev" in package_value:
         url = f"{url}@{package_value['rev']}"
     elif "branch" in package_value:
@@ -270,7 +265,7 @@ def build_bzr_url(package_name: str, package_value: dict[str, str], value: str)
         MyProject @ bzr+http://bzr.example.com/MyProject/trunk@v1.0
     ref: https://pip.pypa.io/en/stable/topics/vcs-support/#bazaar
     """
-    value = re.sub(r"^(bzr@|https://)", r"bzr+https://", value)
+    value = _BZR_PREFIX_RE.sub(r"bzr+https://", value)
     url = f"{package_name}@ {value}"
     if "rev" in package_value:
         url = f"{url}@{package_value['rev']}"
@@ -285,6 +280,15 @@ def build_bzr_url(package_name: str, package_value: dict[str, str], value: str)
     return url
 
 
+# map the poetry dependency's VCS key to the url builder for that VCS
+_VCS_BUILDERS: dict[str, Callable[[str, dict[str, str], str], str]] = {
+    "git": build_git_url,
+    "hg": build_hg_url,
+    "svn": build_svn_url,
+    "bzr": build_bzr_url,
+}
+
+
 def build_vcs_url(package_name: str, package_value: dict[str, Any]) -> set[Requirement]:
     """
     Supported VCS: https://hatch.pypa.io/latest/config/dependency/#supported-vcs
@@ -297,17 +301,11 @@ def build_vcs_url(package_name: str, package_value: dict[str, Any]) -> set[Requi
     }
     VCS URLs: https://pip.pypa.io/en/stable/topics/vcs-support/
     """
-    vcs_builder = {
-        "git": build_git_url,
-        "hg": build_hg_url,
-        "svn": build_svn_url,
-        "bzr": build_bzr_url,
-    }
     out: set[Requirement] = set()
-    for vcs in vcs_builder:
+    for vcs, builder in _VCS_BUILDERS.items():
         if vcs in package_value:
             value = package_value[vcs]
-            url = vcs_builder[vcs](package_name, package_value, value)
+            url = builder(package_name, package_value, value)
             out.add(Requirement(url))
             break
     return out
@@ -319,13 +317,13 @@ def add_leftover_markers_to_url(url: str, package_value: dict[str, str], separat
     markers: set[str] = {mark for mark in package_value if mark not in explicitly_handled_markers}
 
     if markers:
-        _url: str = f"{url}"
+        parts: list[str] = [url]
         for marker in markers:
             if marker == "markers":
-                _url += f"{separator}{package_value[marker]}"
+                parts.append(f"{separator}{package_value[marker]}")
             else:
-                _url += f"{separator}{marker}={package_value[marker]}"
-        return _url
+                parts.append(f"{separator}{marker}={package_value[marker]}")
+        return "".join(parts)
     return url
 
 
@@ -451,8 +449,13 @@ def check_dependencies(key: str | None, project_dependencies: list[str], poetry_
     key_str = f'"{key}" ' if key else ""
     project_requirements: set[Requirement] = {Requirement(dep) for dep in project_dependencies}
     poetry_requirements: set[Requirement] = to_poetry_requirements(poetry_dependencies)
-    logger.debug(f"{key_str}project_requirements: {format_requirement_set(project_requirements)}")
-    logger.debug(f"{key_str}poetry_requirements: {format_requirement_set(poetry_requirements)}")
+    # lazy, so the requirement sets are only sorted and formatted when debug logging is enabled
+    logger.opt(lazy=True).debug(
+        "{}project_requirements: {}", lambda: key_str, lambda: format_requirement_set(project_requirements)
+    )
+    logger.opt(lazy=True).debug(
+        "{}poetry_requirements: {}", lambda: key_str, lambda: format_requirement_set(poetry_requirements)
+    )
     differing_requirements = project_requirements.symmetric_difference(poetry_requirements)
     if len(differing_requirements) > 0:
         number_of_problems += 1
@@ -487,12 +490,23 @@ def check_pyproject_toml(toml_data: dict[str, Any]) -> int:
         return 0
 
     try:
+        # when the tables have no field names in common, every field check would report the same mismatch,
+        # so report it once instead.
+        if not project_data.keys() & poetry_data.keys():
+            logger.warning(
+                f"[project] and [tool.poetry] have no fields in common.\n"
+                f"[project] fields: {sorted(project_data.keys())}\n"
+                f"[tool.poetry] fields: {sorted(poetry_data.keys())}"
+            )
+            return 1
+
         # group field names by the TOML type of their values
         string_field_names: list[str] = ["name", "description", "readme", "version", "scripts", "urls"]
         set_field_names: list[str] = ["keywords", "classifiers"]
         author_field_names: list[str] = ["authors", "maintainers"]
         dependency_field_names: list[str] = ["dependencies"]
-        optional_dependency_keys: set[str] = set(poetry_data["group"]) | set(project_data["optional-dependencies"])
+        # dict key views support set operations, so union them without copying each into a set first
+        optional_dependency_keys: set[str] = poetry_data["group"].keys() | project_data["optional-dependencies"].keys()
 
         # gather all the field names we check, so we can later find the unchecked field names
         checked_field_names: list[str] = (
@@ -544,18 +558,27 @@ def check_pyproject_toml(toml_data: dict[str, Any]) -> int:
 def validate_pyproject_toml_file(project_filename: Path) -> int:
     """read the pyproject.toml file then cross validate the [project] and [tool.poetry] sections."""
     number_of_problems: int = 0
-    try:
-        logger.info(f"Reading pyproject.toml file: {project_filename}")
-        with Path(project_filename).open(encoding="utf-8") as f:
-            number_of_problems += check_pyproject_toml(toml_data=tomllib.loads(f.read()))
-    except FileNotFoundError:
-        logger.error(f'"{project_filename}" is not a file.')
-        number_of_problems = 1  # one error
-    except IsADirectoryError:
+    project_path = Path(project_filename)
+    logger.info(f"Reading pyproject.toml file: {project_filename}")
+    # check the path up front instead of failing the open
+    if project_path.is_dir():
         logger.error(f'"{project_filename}" is a directory, not a pyproject.toml file.')
         number_of_problems = 1  # one error
-    except ValueError as err:
-        logger.error(f"Unable to parse {project_filename}: {err}")
+    elif not project_path.exists():
+        logger.error(f'"{project_filename}" is not a file.')
         number_of_problems = 1  # one error
+    else:
+        try:
+            # tomllib reads and decodes the binary file itself, avoiding an intermediate str copy
+            with project_path.open("rb") as f:
+                toml_data = tomllib.load(f)
+            number_of_problems += check_pyproject_toml(toml_data=toml_data)
+        except OSError as err:
+            # ex: removed or unreadable after the checks above
+            logger.error(f"Unable to read {project_filename}: {err}")
+            number_of_problems = 1  # one error
+        except ValueError as err:
+            logger.error(f"Unable to parse {project_filename}: {err}")
+            number_of_problems = 1  # one error
     logger.info(f"Check pyproject.toml file: {project_filename} => {number_of_problems} problems detected.\n")
     return number_of_problems
@@ -194,10 +194,11 @@ class ApplicationSettings(ABC):
             self._settings.parser = self._parser
         return self._settings
 
-    def __exit__(self, *exc: Any) -> None:  # NOQA: B027
+    def __exit__(self, *exc: Any) -> None:
         """
-        context manager exit
+        context manager exit, flushes any buffered log file messages.
         """
+        self.logger_control.sync()
 
     def help(self) -> int:
         """
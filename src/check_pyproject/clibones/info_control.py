@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import importlib
 from dataclasses import dataclass
+from functools import lru_cache
 from importlib import metadata
 from typing import TYPE_CHECKING
 
@@ -16,6 +17,19 @@ if TYPE_CHECKING:
     from argparse import ArgumentParser
 
 
+@lru_cache(maxsize=8)
+def _package_version(app_package: str) -> str | None:
+    """
+    Get the installed distribution's version from its metadata without importing the package.
+
+    :return: the version string or None if the package's metadata is not found
+    """
+    try:
+        return metadata.version(app_package)
+    except metadata.PackageNotFoundError:
+        return None
+
+
 @dataclass
 class InfoControl:
     """Add information control (--version, --longhelp) argument support to a CLI application."""
@@ -57,20 +71,16 @@ class InfoControl:
 
     def _load_version(self) -> str:
         r"""
-        Get the version from the application package's __version__ attribute.
+        Get the version from the application package's installed metadata.
         If not found then return DEFAULT_VERSION
 
         :return: the version string or DEFAULT_VERSION
         """
         if self.app_package:
-            try:
-                return metadata.version(self.app_package)
-            except (ImportError, importlib.metadata.PackageNotFoundError):
-                logger.warning(f"Could not get metadata for {self.app_package}")
-                try:
-                    return str(__import__(self.app_package).version)
-                except (ImportError, AttributeError, ValueError):
-                    logger.warning(f"Could not import {self.app_package}.version")
+            version = _package_version(self.app_package)
+            if version is not None:
+                return version
+            logger.info(f"Could not get metadata for {self.app_package}")
         return InfoControl.DEFAULT_VERSION
 
     def _load_longhelp(self) -> str:
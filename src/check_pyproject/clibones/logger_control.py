@@ -6,8 +6,8 @@ from __future__ import annotations
 
 import argparse
 import sys
-from collections.abc import Sequence
-from typing import TYPE_CHECKING, Any
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 from loguru import logger
 from pathvalidate.argparse import validate_filepath_arg
@@ -15,6 +15,8 @@ from pathvalidate.argparse import validate_filepath_arg
 if TYPE_CHECKING:
     from argparse import ArgumentParser
 
+    from loguru import Message
+
 
 # Default loguru format for colorized output
 LOGURU_FORMAT = (
@@ -28,16 +30,55 @@ LOGURU_MEDIUM_FORMAT = "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}
 LOGURU_SHORT_FORMAT = "<level>{message}</level>"
 
 
+class BufferedFileSink:
+    """
+    A loguru sink that writes log messages to a file through a large buffer instead of one write per message.
+
+    ERROR and higher messages flush the buffer immediately so they are not lost if the application dies.
+    Note, loguru flushes stream sinks after every message when they have a flush() method, so the explicit
+    flush is named sync().
+    """
+
+    BUFFER_SIZE: int = 64 * 1024
+    FLUSH_LEVEL_NO: int = 40  # loguru's ERROR severity
+
+    def __init__(self, filename: str | Path) -> None:
+        path = Path(filename)
+        # like loguru's own file sink, create any missing parent directories
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = path.open("a", encoding="utf-8", buffering=BufferedFileSink.BUFFER_SIZE)
+
+    def write(self, message: Message) -> None:
+        """Buffer the formatted message, flushing for ERROR and higher."""
+        self._file.write(message)
+        if message.record["level"].no >= BufferedFileSink.FLUSH_LEVEL_NO:
+            self._file.flush()
+
+    def sync(self) -> None:
+        """Flush any buffered messages to the file."""
+        if not self._file.closed:
+            self._file.flush()
+
+    def stop(self) -> None:
+        """Called by loguru when the sink is removed (including at exit).  Flushes and closes the file."""
+        self._file.close()
+
+
 class LoggerControl:
     """Add logger control arguments (--loglevel, --debug, --quiet, --logfile) to CLI application."""
 
-    VALID_LOG_LEVELS: Sequence[str] = (
+    # ordered for argparse choices and help, cannot select NOTSET
+    VALID_LOG_LEVELS: tuple[str, ...] = (
         "DEBUG",
         "INFO",
         "WARNING",
         "ERROR",
         "CRITICAL",
-    )  # cannot select NOTSET
+    )
+    # for constant time validation
+    _VALID_LOG_LEVEL_SET: frozenset[str] = frozenset(VALID_LOG_LEVELS)
+
+    _logfile_sink: BufferedFileSink | None = None
 
     # noinspection PyMethodMayBeStatic
     def add_arguments(self, parser: ArgumentParser) -> None:
@@ -77,38 +118,39 @@ class LoggerControl:
 
     @staticmethod
     def setup(settings: argparse.Namespace) -> None:
-        level = "INFO"
         error_messages = []
 
-        # convert settings to dictionary, so we can test if argument was passed
-        settings_dict: dict[str, Any] = vars(settings)
+        # read the arguments with defaults, as the namespace may not have been built by our add_arguments()
+        level = getattr(settings, "loglevel", "INFO")
+        if level not in LoggerControl._VALID_LOG_LEVEL_SET:
+            error_messages.append(
+                f"Invalid log level {level}, " f"should be one of the following: {LoggerControl.VALID_LOG_LEVELS}"
+            )
+            level = "INFO"
 
-        # the order of the loglevel processing is important.
         # --quiet has the highest priority followed by --debug then --loglevel
-        if "loglevel" in settings_dict:
-            level = settings_dict["loglevel"]
-            if level not in LoggerControl.VALID_LOG_LEVELS:
-                error_messages.append(
-                    f"Invalid log level {level}, " f"should be one of the following: {LoggerControl.VALID_LOG_LEVELS}"
-                )
-                level = "INFO"
-
-        if settings_dict.get("debug"):
-            level = "DEBUG"
-
-        if settings_dict.get("quiet"):
-            level = "ERROR"
+        quiet: bool = getattr(settings, "quiet", False)
+        debug: bool = getattr(settings, "debug", False)
+        level = "ERROR" if quiet else "DEBUG" if debug else level
 
         settings.loglevel = level
         logger.remove(None)
+        LoggerControl._logfile_sink = None
         logger.add(sys.stdout, level=settings.loglevel, format=LOGURU_SHORT_FORMAT)
 
-        if settings_dict.get("logfile"):
-            filename = settings_dict["logfile"]
+        filename = getattr(settings, "logfile", None)
+        if filename:
             try:
-                logger.add(filename, level=settings.loglevel)
+                LoggerControl._logfile_sink = BufferedFileSink(filename)
+                logger.add(LoggerControl._logfile_sink, level=settings.loglevel)
             except OSError as ex:
                 error_messages += [f"Could not open logfile ({filename}): {ex}"]
 
         for msg in error_messages:
             logger.error(msg)
+
+    @staticmethod
+    def sync() -> None:
+        """Flush any log messages still buffered for the --logfile file."""
+        if LoggerControl._logfile_sink is not None:
+            LoggerControl._logfile_sink.sync()
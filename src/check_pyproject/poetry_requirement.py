@@ -5,13 +5,37 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from packaging.specifiers import SpecifierSet
 from packaging.version import Version
 
 from check_pyproject.version_utils import VersionUtils
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
+# whitespace between an operator and its version, ex: ">= 1.2"
+_WS_AFTER_OP_RE = re.compile(r"([\^~<>=!]+)\s+")
+# separator between multiple specifiers, ex: ">=1.2, <1.5"
+_COMMA_SPLIT_RE = re.compile(r",\s*")
+# operator followed by the version to quote, ex: '>=3.8' becomes '>="3.8"'
+_QUOTE_WRAP_RE = re.compile(r"([~<>=!]+)(.+)")
+
+# the pep508 equivalent of the "*" wildcard, i.e. any version
+_ANY_VERSION_SPECIFIER = ">=0.0.0"
+
+
+def _bounded_specifier(lower: str, upper: str) -> str:
+    """
+    Format the ">=lower, <upper" specifier.  The SpecifierSet round trip validates the result (ex: a padded
+    pre-release "2.0rc1.0" is not a valid version) and only runs on a cache miss of the calling converter.
+    """
+    return str(SpecifierSet(f">={lower}, <{upper}"))
+
+
+@lru_cache(maxsize=1024)
 def caret_requirement_to_pep508(specification: str, *, max_bounds: bool = True) -> str:
     """
     Caret requirements allow SemVer compatible updates to a specified version. An update is allowed if the
@@ -20,17 +44,15 @@ def caret_requirement_to_pep508(specification: str, *, max_bounds: bool = True)
     By default, an upper bound will be generated (ex:  "^1.2.3" becomes ">=1.2.3,<2.0.0").
     To disable this behavior, set max_bounds to False (ex:  "^1.2.3" becomes ">=1.2.3").
     """
+    lower: str = VersionUtils.fill_version_to_three_parts(specification)
     if max_bounds:
-        return str(
-            SpecifierSet(
-                f">={VersionUtils.fill_version_to_three_parts(specification)}, "
-                f"<{VersionUtils.fill_version_to_three_parts(str(VersionUtils.max_version(specification)))}"
-            )
-        )
+        upper: str = VersionUtils.fill_version_to_three_parts(str(VersionUtils.max_version(specification)))
+        return _bounded_specifier(lower, upper)
 
-    return str(SpecifierSet(f">={VersionUtils.fill_version_to_three_parts(specification)}"))
+    return str(SpecifierSet(f">={lower}"))
 
 
+@lru_cache(maxsize=1024)
 def tilde_requirement_to_pep508(specification: str) -> str:
     """
     Tilde requirements specify a minimal version with some ability to update. If you specify a major, minor,
@@ -42,16 +64,14 @@ def tilde_requirement_to_pep508(specification: str) -> str:
       "~1.2" becomes ">=1.2.0, <1.3.0"
       "~1" becomes ">=1.0.0, <2.0.0"
     """
-    ver: Version = Version(specification)
+    ver: Version = VersionUtils.parse_version(specification)
     ver = VersionUtils.bump_major_version(ver) if len(ver.release) == 1 else VersionUtils.bump_minor_version(ver)
-    return str(
-        SpecifierSet(
-            f">={VersionUtils.fill_version_to_three_parts(specification)}, "
-            f" <{VersionUtils.fill_version_to_three_parts(str(ver))}"
-        )
-    )
+    lower: str = VersionUtils.fill_version_to_three_parts(specification)
+    upper: str = VersionUtils.fill_version_to_three_parts(str(ver))
+    return _bounded_specifier(lower, upper)
 
 
+@lru_cache(maxsize=1024)
 def wildcard_requirement_to_pep508(specification: str) -> str:
     """
     Wildcard requirements allow for the latest (dependency dependent) version where the wildcard
@@ -63,22 +83,47 @@ def wildcard_requirement_to_pep508(specification: str) -> str:
     "1.2.*" becomes ">=1.2.0, <1.3.0"
     """
     if specification == "*":
-        return str(SpecifierSet(f">={VersionUtils.fill_version_to_three_parts('0')}"))
-
-    version_string: str = specification.rstrip("*").rstrip(".")  # ex: "1", "1.2"
-    ver: Version = Version(version_string)
+        return _ANY_VERSION_SPECIFIER
+
+    # slice the wildcard off once, ex: "1.2.*" -> "1.2", "1*" -> "1"
+    version_string: str
+    if specification.endswith(".*"):
+        version_string = specification[:-2]
+    elif specification.endswith("*"):
+        version_string = specification[:-1].rstrip(".")
+    else:
+        version_string = specification
+    ver: Version = VersionUtils.parse_version(version_string)
 
     if len(ver.release) == 1:
         ver = VersionUtils.bump_major_version(ver)
     elif len(ver.release) == 2:
         ver = VersionUtils.bump_minor_version(ver)
 
-    return str(
-        SpecifierSet(
-            f">={VersionUtils.fill_version_to_three_parts(version_string)}, "
-            f" <{VersionUtils.fill_version_to_three_parts(str(ver))}"
-        )
-    )
+    lower: str = VersionUtils.fill_version_to_three_parts(version_string)
+    upper: str = VersionUtils.fill_version_to_three_parts(str(ver))
+    return _bounded_specifier(lower, upper)
+
+
+# map the poetry specifier's prefix character (ex: ^1.2, ~1.2) to its converter
+_PREFIX_CONVERTERS: dict[str, Callable[[str, bool], str]] = {
+    "^": lambda version, max_bounds: caret_requirement_to_pep508(version, max_bounds=max_bounds),
+    "~": lambda version, _max_bounds: tilde_requirement_to_pep508(version),
+}
+
+
+@lru_cache(maxsize=1024)
+def _convert_single(requirement: str, *, max_bounds: bool) -> str:
+    """
+    Convert a single poetry specifier (ex: "^1.2", ">=1.2") to pep508 format.  Cached separately from the
+    full specifier string because the same operator-prefixed tokens repeat across differing specifier strings.
+    """
+    converter = _PREFIX_CONVERTERS.get(requirement[:1])
+    if converter is not None:
+        return converter(requirement[1:], max_bounds)
+    if "*" in requirement:
+        return wildcard_requirement_to_pep508(requirement)
+    return str(SpecifierSet(VersionUtils.fill_version_to_three_parts(requirement)))
 
 
 def convert_poetry_specifier_to_pep508(
@@ -88,23 +133,24 @@ def convert_poetry_specifier_to_pep508(
     Convert poetry dependency specifiers (^v.v, ~ v.v, v.*, <=v, > v, != v) to pep508 format
     returns a string containing comma separated pep508 specifiers
     """
-    out: list[str] = []
-    requirement: str
     if isinstance(value, str):
-        value = re.sub(r"([\^~<>=!]+)\s+", r"\1", value)
-        for requirement in re.split(r",\s*", value):
-            # ^a.b.c
-            if requirement.startswith("^"):
-                out.append(caret_requirement_to_pep508(requirement[1:], max_bounds=max_bounds))
-            elif requirement.startswith("~"):
-                out.append(tilde_requirement_to_pep508(requirement[1:]))
-            elif "*" in requirement:
-                out.append(wildcard_requirement_to_pep508(requirement))
-            else:
-                out.append(str(SpecifierSet(VersionUtils.fill_version_to_three_parts(requirement))))
+        return _convert_specifier_str(value, max_bounds=max_bounds, quotes=quotes)
+    return ""
+
+
+@lru_cache(maxsize=1024)
+def _convert_specifier_str(value: str, *, max_bounds: bool, quotes: bool) -> str:
+    """
+    The string conversion for convert_poetry_specifier_to_pep508.  Cached because the same specifiers
+    (ex: "^1.2.3", ">=3.10") repeat across dependencies.
+    """
+    value = _WS_AFTER_OP_RE.sub(r"\1", value)
+    out: list[str] = [
+        _convert_single(requirement, max_bounds=max_bounds) for requirement in _COMMA_SPLIT_RE.split(value)
+    ]
 
     result = ",".join(out)
     if quotes:
-        result = re.sub(r"([~<>=!]+)(.+)", r'\1"\2"', result)
+        result = _QUOTE_WRAP_RE.sub(r'\1"\2"', result)
 
     return result
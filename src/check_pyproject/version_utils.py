@@ -4,21 +4,31 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from packaging.version import Version
 
 
 class VersionUtils:
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def parse_version(version_str: str) -> Version:
+        """
+        Parse the version string into a Version.  Cached because Version parsing runs a regex and the
+        same version strings are parsed repeatedly.  Safe to share as Version instances are immutable.
+        """
+        return Version(version_str)
+
     @staticmethod
     def bump_major_version(version: Version) -> Version:
         """
         Increment the major version by 1 and zeroing the minor and patch versions and removing any pre,
         post, development, or local segments.  Preserves the epoch.
         """
-        epoch_str = f"{version.epoch}!" if version.epoch else ""
-        major = 0
-        if len(version.release) >= 1:
-            major = version.release[0]
-        return Version(f"{epoch_str}{major + 1}.0.0")
+        major: int = (*version.release, 0)[0]
+        if version.epoch:
+            return VersionUtils.parse_version(f"{version.epoch}!{major + 1}.0.0")
+        return VersionUtils.parse_version(f"{major + 1}.0.0")
 
     @staticmethod
     def bump_minor_version(version: Version) -> Version:
@@ -26,14 +36,10 @@ class VersionUtils:
         Increment the minor version by 1 and zeroing the patch version and removing any pre,
         post, development, or local segments.  Preserves the epoch and major version.
         """
-        epoch_str = f"{version.epoch}!" if version.epoch else ""
-        major: int = 0
-        minor: int = 0
-        if len(version.release) >= 1:
-            major = version.release[0]
-        if len(version.release) >= 2:
-            minor = version.release[1]
-        return Version(f"{epoch_str}{major}.{minor + 1}.0")
+        major, minor = (*version.release, 0, 0)[:2]
+        if version.epoch:
+            return VersionUtils.parse_version(f"{version.epoch}!{major}.{minor + 1}.0")
+        return VersionUtils.parse_version(f"{major}.{minor + 1}.0")
 
     @staticmethod
     def bump_patch_version(version: Version) -> Version:
@@ -41,17 +47,10 @@ class VersionUtils:
         Increment the patch (micro) version by 1 and removing any pre, post, development,
         or local segments.  Preserves the epoch and major version.
         """
-        epoch_str = f"{version.epoch}!" if version.epoch else ""
-        major: int = 0
-        minor: int = 0
-        patch: int = 0
-        if len(version.release) >= 1:
-            major = version.release[0]
-        if len(version.release) >= 2:
-            minor = version.release[1]
-        if len(version.release) >= 3:
-            patch = version.release[2]
-        return Version(f"{epoch_str}{major}.{minor}.{patch + 1}")
+        major, minor, patch = (*version.release, 0, 0, 0)[:3]
+        if version.epoch:
+            return VersionUtils.parse_version(f"{version.epoch}!{major}.{minor}.{patch + 1}")
+        return VersionUtils.parse_version(f"{major}.{minor}.{patch + 1}")
 
     @staticmethod
     def max_version(version_str: str) -> Version:
@@ -65,7 +64,7 @@ class VersionUtils:
             "0.0 will bump to "0.1.0"
             "0.0.0 will bump to "0.1.0"
         """
-        ver: Version = Version(version_str)
+        ver: Version = VersionUtils.parse_version(version_str)
         if ver.major:
             ver = VersionUtils.bump_major_version(ver)
         elif ver.minor:
@@ -82,12 +81,12 @@ class VersionUtils:
         return ver
 
     @staticmethod
+    @lru_cache(maxsize=512)
     def fill_version_to_three_parts(version_str: str) -> str:
         """
         Fill out requirement to at least 3 parts, ex: 1.2 => 1.2.0
         """
         if not version_str:
             return "0.0.0"
-        while len(version_str.split(".")) < 3:
-            version_str += ".0"
-        return version_str
+        # a negative count repeats to "", so versions with 3 or more parts are returned as is
+        return version_str + ".0" * (2 - version_str.count("."))
@@ -0,0 +1,56 @@
+# SPDX-FileCopyrightText: 2024 Roy Wright
+#
+# SPDX-License-Identifier: MIT
+
+"""shared fixtures for the tests"""
+
+from __future__ import annotations
+
+import sys
+import tomllib
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from loguru import logger
+
+from check_pyproject.clibones.logger_control import LOGURU_SHORT_FORMAT
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# the tests directory
+tests_dir = Path(__file__).parent
+
+
+@cache
+def _load_toml(filename: str) -> dict[str, Any]:
+    """Parse the named toml file from the tests directory, once per test session."""
+    with (tests_dir / filename).open("rb") as f:
+        return tomllib.load(f)
+
+
+@pytest.fixture(scope="session")
+def load_toml() -> Callable[[str], dict[str, Any]]:
+    """
+    Returns a loader for the toml files in the tests directory.  Each file is parsed once per test session
+    and the same dict is returned to every test, so do not modify it.
+    """
+    return _load_toml
+
+
+@pytest.fixture(scope="session")
+def good_toml(load_toml: Callable[[str], dict[str, Any]]) -> dict[str, Any]:
+    """The parsed good_pyproject.toml, parsed once per test session.  Do not modify."""
+    return load_toml("good_pyproject.toml")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _loguru_sink() -> None:
+    """
+    Send warning and higher log messages to stderr once for the whole test session instead of per test module.
+    Formatting and writing the debug chatter of every check is the bulk of the logging cost under test.
+    """
+    logger.remove(None)
+    logger.add(sys.stderr, level="WARNING", format=LOGURU_SHORT_FORMAT)
@@ -4,135 +4,181 @@
 
 from __future__ import annotations
 
-import sys
+import os
+import threading
 import tomllib
 from pathlib import Path
 from pprint import pformat
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import pytest
 from loguru import logger
 from packaging.requirements import Requirement
-from packaging.specifiers import SpecifierSet
+from packaging.specifiers import InvalidSpecifier, SpecifierSet
 
 from check_pyproject.check_pyproject_toml import (
     add_leftover_markers_to_url,
     check_fields,
+    check_pyproject_toml,
     format_diff_values,
     string_field,
     to_poetry_requirements,
     validate_pyproject_toml_file,
 )
-from check_pyproject.clibones.logger_control import LOGURU_SHORT_FORMAT
 from check_pyproject.poetry_requirement import caret_requirement_to_pep508, convert_poetry_specifier_to_pep508
 from check_pyproject.version_utils import VersionUtils
 
-logger.remove(None)
-logger.add(sys.stderr, level="DEBUG", format=LOGURU_SHORT_FORMAT)
-
-
-def test_all_good_pyproject() -> None:
-    number_of_problems: int = validate_pyproject_toml_file(Path(__file__).parent / "good_pyproject.toml")
-    assert number_of_problems == 0
-
-
-def test_optional_deps_pyproject() -> None:
-    number_of_problems: int = validate_pyproject_toml_file(Path(__file__).parent / "optional_deps_pyproject.toml")
-    assert number_of_problems == 0
-
-
-def test_all_bad_pyproject() -> None:
-    number_of_problems: int = validate_pyproject_toml_file(Path(__file__).parent / "bad_pyproject.toml")
-    assert number_of_problems == 14
-
-
-def test_bad_python_pyproject() -> None:
-    number_of_problems: int = validate_pyproject_toml_file(Path(__file__).parent / "bad_python_pyproject_1.toml")
-    assert number_of_problems == 1
-
-
-def test_bad_python_pyproject_2() -> None:
-    number_of_problems: int = validate_pyproject_toml_file(Path(__file__).parent / "bad_python_pyproject_2.toml")
-    assert number_of_problems == 1
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# the tests directory
+tests_dir = Path(__file__).parent
+
+
+# poetry VCS dependencies for the VCS tests, parsed once per VCS
+VCS_DEPENDENCIES_TEMPLATE = """
+foo1 = {{{vcs} = "https://foohub.com/foo1/foo1.{vcs}"}}
+foo2 = {{{vcs} = "https://foohub.com/foo2/foo2.{vcs}", branch = "next"}}
+foo3 = {{{vcs} = "https://foohub.com/foo3/foo3.{vcs}", rev = "38eb5d3b"}}
+foo4 = {{{vcs} = "https://foohub.com/foo4/foo4.{vcs}", tag = "v0.13.2"}}
+foo5 = {{{vcs} = "https://foohub.com/foo5/foo5.{vcs}", subdirectory = "subdir"}}
+"""
+VCS_DEPENDENCIES: dict[str, dict[str, Any]] = {
+    vcs: tomllib.loads(VCS_DEPENDENCIES_TEMPLATE.format(vcs=vcs)) for vcs in ("hg", "svn", "bzr")
+}
+# the requirements expected from VCS_DEPENDENCIES, parsed once per VCS
+VCS_TARGET_REQUIREMENTS: dict[str, frozenset[Requirement]] = {
+    vcs: frozenset(
+        {
+            Requirement(f"foo1@ {vcs}+https://foohub.com/foo1/foo1.{vcs}"),
+            Requirement(f"foo2@ {vcs}+https://foohub.com/foo2/foo2.{vcs}@next"),
+            Requirement(f"foo3@ {vcs}+https://foohub.com/foo3/foo3.{vcs}@38eb5d3b"),
+            Requirement(f"foo4@ {vcs}+https://foohub.com/foo4/foo4.{vcs}@v0.13.2"),
+            Requirement(f"foo5@ {vcs}+https://foohub.com/foo5/foo5.{vcs}/subdir"),
+        }
+    )
+    for vcs in VCS_DEPENDENCIES
+}
 
 
-def test_bad_python_pyproject_3() -> None:
-    number_of_problems: int = validate_pyproject_toml_file(Path(__file__).parent / "bad_python_pyproject_3.toml")
-    assert number_of_problems == 0
+# (fixture toml file in the tests directory, expected number of problems)
+FIXTURE_FILE_CASES: list[tuple[str, int]] = [
+    ("good_pyproject.toml", 0),
+    ("optional_deps_pyproject.toml", 0),
+    ("bad_pyproject.toml", 14),
+    ("bad_python_pyproject_1.toml", 1),
+    ("bad_python_pyproject_2.toml", 1),
+    ("bad_python_pyproject_3.toml", 0),
+    ("mixed_pyproject.toml", 6),
+]
 
 
-def test_mixed_pyproject() -> None:
-    number_of_problems: int = validate_pyproject_toml_file(Path(__file__).parent / "mixed_pyproject.toml")
-    assert number_of_problems == 6
+@pytest.mark.parametrize(("filename", "expected"), FIXTURE_FILE_CASES)
+def test_fixture_pyproject(load_toml: Callable[[str], dict[str, Any]], filename: str, expected: int) -> None:
+    number_of_problems: int = check_pyproject_toml(load_toml(filename))
+    assert number_of_problems == expected
 
 
 def test_nonexistent_file() -> None:
-    number_of_problems: int = validate_pyproject_toml_file(Path(__file__).parent / "xyzzy")  # :-)
+    number_of_problems: int = validate_pyproject_toml_file(tests_dir / "xyzzy")  # :-)
     assert number_of_problems == 1
 
 
 def test_invalid_pyproject_file() -> None:
     # ASSUMES README.md is in the parent directory of the directory of this test
     # i.e.: ./this_test.py and ../README.md
-    number_of_problems: int = validate_pyproject_toml_file(Path(__file__).parent.parent / "README.md")
+    number_of_problems: int = validate_pyproject_toml_file(tests_dir.parent / "README.md")
     assert number_of_problems == 1
 
 
 def test_directory() -> None:
     # ASSUMES pyproject.toml is in the parent directory of the directory of this test
     # i.e.: ./this_test.py so ../pyproject.toml
-    number_of_problems: int = validate_pyproject_toml_file(Path(__file__).parent.parent)
+    number_of_problems: int = validate_pyproject_toml_file(tests_dir.parent)
     assert number_of_problems == 1
 
 
-def test_missing_field() -> None:
-    with (Path(__file__).parent / "good_pyproject.toml").open(encoding="utf-8") as f:
-        toml_data: dict[str, Any] = tomllib.loads(f.read())
-    assert check_fields(string_field, ["bogus"], toml_data) == 0
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="requires named pipes")
+def test_named_pipe(tmp_path: Path) -> None:
+    # a pyproject.toml piped in, ex: check_pyproject <(cat pyproject.toml), is not a regular file
+    fifo = tmp_path / "pyproject.toml"
+    os.mkfifo(fifo)
+    # opening a fifo for writing blocks until the reader opens it, so write from another thread
+    writer = threading.Thread(target=fifo.write_bytes, args=((tests_dir / "good_pyproject.toml").read_bytes(),))
+    writer.start()
+    try:
+        number_of_problems: int = validate_pyproject_toml_file(fifo)
+    finally:
+        if writer.is_alive():
+            # the fifo was never read, release the writer so the test fails instead of hanging
+            fifo.read_bytes()
+        writer.join()
+    assert number_of_problems == 0
 
 
-def test_convert_poetry_to_pep508() -> None:
-    # ref: https://python-poetry.org/docs/dependency-specification/
-    # Caret requirements
-    assert SpecifierSet(">=1.2.3, <2.0.0") == SpecifierSet(convert_poetry_specifier_to_pep508("^1.2.3")), "^1.2.3"
+def test_missing_field(good_toml: dict[str, Any]) -> None:
+    assert check_fields(string_field, ["bogus"], good_toml) == 0
 
-    assert SpecifierSet(">=1.2.0, <2.0.0") == SpecifierSet(convert_poetry_specifier_to_pep508("^1.2")), "^1.2"
-    assert SpecifierSet(">=1.0.0, <2.0.0") == SpecifierSet(convert_poetry_specifier_to_pep508("^1")), "^1"
-    assert SpecifierSet(">=0.2.3, <0.3.0") == SpecifierSet(convert_poetry_specifier_to_pep508("^0.2.3")), "^0.2.3"
-    assert SpecifierSet(">=0.0.3, <0.0.4") == SpecifierSet(convert_poetry_specifier_to_pep508("^0.0.3")), "^0.0.3"
-    assert SpecifierSet(">=0.0.0, <0.1.0") == SpecifierSet(convert_poetry_specifier_to_pep508("^0.0")), "^0.0"
-    assert SpecifierSet(">=0.0.0, <1.0.0") == SpecifierSet(convert_poetry_specifier_to_pep508("^0")), "^0"
 
-    # Tilde requirements
-    assert SpecifierSet(">=1.2.3, <1.3.0") == SpecifierSet(convert_poetry_specifier_to_pep508("~1.2.3")), "~1.2.3"
-    assert SpecifierSet(">=1.2.0, <1.3.0") == SpecifierSet(convert_poetry_specifier_to_pep508("~1.2")), "~1.2"
-    assert SpecifierSet(">=1.0.0, <2.0.0") == SpecifierSet(convert_poetry_specifier_to_pep508("~1")), "~1"
+def test_no_common_fields() -> None:
+    toml_data: dict[str, Any] = {
+        "project": {"name": "foo"},
+        "tool": {"poetry": {"authors": ["Foo <foo@example.com>"]}},
+    }
+    messages: list[str] = []
+    handler_id = logger.add(messages.append, level="WARNING", format="{message}")
+    try:
+        assert check_pyproject_toml(toml_data) == 1
+    finally:
+        logger.remove(handler_id)
+    # reported once by the short-circuit, not as an exception from the field checks
+    assert any("have no fields in common" in message for message in messages)
+    assert not any("Problem checking pyproject.toml" in message for message in messages)
 
-    # Wildcard requirements
-    assert SpecifierSet(">=0.0.0") == SpecifierSet(convert_poetry_specifier_to_pep508("*")), "*"
-    assert SpecifierSet(">=1.0.0, <2.0.0") == SpecifierSet(convert_poetry_specifier_to_pep508("1.*")), "1.*"
-    assert SpecifierSet(">=1.2.0, <1.3.0") == SpecifierSet(convert_poetry_specifier_to_pep508("1.2.*")), "1.2.*"
 
-    # Inequality requirements
-    assert SpecifierSet(">=1.2.0") == SpecifierSet(convert_poetry_specifier_to_pep508(">= 1.2.0")), ">= 1.2.0"
-    assert SpecifierSet(">1.0.0") == SpecifierSet(convert_poetry_specifier_to_pep508("> 1")), "> 1"
-    assert SpecifierSet("<2.0.0") == SpecifierSet(convert_poetry_specifier_to_pep508("< 2")), "< 2"
-    assert SpecifierSet("!=1.2.4") == SpecifierSet(convert_poetry_specifier_to_pep508("!= 1.2.4")), "!= 1.2.4"
+def test_non_table_sections() -> None:
+    toml_data: dict[str, Any] = tomllib.loads('project = "x"\n[tool]\npoetry = "y"\n')
+    assert check_pyproject_toml(toml_data) == 1
 
-    # Multiple requirements
-    assert SpecifierSet(">=1.2.0, !=1.2.4") == SpecifierSet(
-        convert_poetry_specifier_to_pep508(">= 1.2.0, != 1.2.4")
-    ), ">= 1.2.0, != 1.2.4"
-    assert SpecifierSet(">=1.2.0, <1.5.0") == SpecifierSet(
-        convert_poetry_specifier_to_pep508(">= 1.2, < 1.5")
-    ), ">= 1.2, < 1.5"
 
+# (poetry specifier, the expected pep508 specifier set)
+# ref: https://python-poetry.org/docs/dependency-specification/
+POETRY_TO_PEP508_CASES: list[tuple[str, SpecifierSet]] = [
+    # Caret requirements
+    ("^1.2.3", SpecifierSet(">=1.2.3, <2.0.0")),
+    ("^1.2", SpecifierSet(">=1.2.0, <2.0.0")),
+    ("^1", SpecifierSet(">=1.0.0, <2.0.0")),
+    ("^0.2.3", SpecifierSet(">=0.2.3, <0.3.0")),
+    ("^0.0.3", SpecifierSet(">=0.0.3, <0.0.4")),
+    ("^0.0", SpecifierSet(">=0.0.0, <0.1.0")),
+    ("^0", SpecifierSet(">=0.0.0, <1.0.0")),
+    # Tilde requirements
+    ("~1.2.3", SpecifierSet(">=1.2.3, <1.3.0")),
+    ("~1.2", SpecifierSet(">=1.2.0, <1.3.0")),
+    ("~1", SpecifierSet(">=1.0.0, <2.0.0")),
+    # Wildcard requirements
+    ("*", SpecifierSet(">=0.0.0")),
+    ("1.*", SpecifierSet(">=1.0.0, <2.0.0")),
+    ("1.2.*", SpecifierSet(">=1.2.0, <1.3.0")),
+    # Inequality requirements
+    (">= 1.2.0", SpecifierSet(">=1.2.0")),
+    ("> 1", SpecifierSet(">1.0.0")),
+    ("< 2", SpecifierSet("<2.0.0")),
+    ("!= 1.2.4", SpecifierSet("!=1.2.4")),
+    # Multiple requirements
+    (">= 1.2.0, != 1.2.4", SpecifierSet(">=1.2.0, !=1.2.4")),
+    (">= 1.2, < 1.5", SpecifierSet(">=1.2.0, <1.5.0")),
     # Exact requirements
-    assert SpecifierSet("==1.2.3") == SpecifierSet(convert_poetry_specifier_to_pep508("==1.2.3")), "==1.2.3"
-    assert SpecifierSet("==1.2.0") == SpecifierSet(convert_poetry_specifier_to_pep508("==1.2")), "==1.2"
-    assert SpecifierSet("==1.0.0") == SpecifierSet(convert_poetry_specifier_to_pep508("==1")), "==1"
+    ("==1.2.3", SpecifierSet("==1.2.3")),
+    ("==1.2", SpecifierSet("==1.2.0")),
+    ("==1", SpecifierSet("==1.0.0")),
+]
+# note, packaging module does not allow bare version numbers, ex: "1.2.3"
 
-    # note, packaging module does not allow bare version numbers, ex: "1.2.3"
+
+@pytest.mark.parametrize(("poetry_specifier", "expected"), POETRY_TO_PEP508_CASES)
+def test_convert_poetry_to_pep508(poetry_specifier: str, expected: SpecifierSet) -> None:
+    assert expected == SpecifierSet(convert_poetry_specifier_to_pep508(poetry_specifier)), poetry_specifier
 
 
 def test_fill_version_to_three_parts() -> None:
@@ -142,15 +188,22 @@ def test_fill_version_to_three_parts() -> None:
     assert VersionUtils.fill_version_to_three_parts("0.0.0") == "0.0.0"
 
 
+# the expected requirement strings for the to_poetry_requirements tests, parsed once
+EXP_UNICORN_ALL_GEVENT = str(Requirement("unicorn[all,gevent]>=20.1.0"))
+EXP_UNICORN_GEVENT_MYSQL = str(Requirement("unicorn[gevent,mysql]>=20.1.1"))
+EXP_UNICORN = str(Requirement("unicorn>=20.1.0"))
+EXP_CHECK_PYPROJECT_GIT = str(Requirement("check-pyproject@ git+https://github.com:royw/check_pyproject.git"))
+
+
 def test_dependency_extras() -> None:
-    expected: str = str(Requirement("unicorn[all,gevent]>=20.1.0"))
+    expected: str = EXP_UNICORN_ALL_GEVENT
     results: set[Requirement] = to_poetry_requirements({"unicorn": {"extras": ["gevent", "all"], "version": ">=20.1"}})
     assert len(results) == 1, "one pep508 requirement generated"
     assert expected == str(results.pop()), "unicorn[gevent]>=20.1.0"
 
 
 def test_dependency_two_extras() -> None:
-    expected: str = str(Requirement("unicorn[gevent,mysql]>=20.1.1"))
+    expected: str = EXP_UNICORN_GEVENT_MYSQL
     results: set[Requirement] = to_poetry_requirements(
         {"unicorn": {"extras": ["gevent", "mysql"], "version": ">=20.1.1"}}
     )
@@ -159,14 +212,14 @@ def test_dependency_two_extras() -> None:
 
 
 def test_optional_dependency() -> None:
-    expected: str = str(Requirement("unicorn>=20.1.0"))
+    expected: str = EXP_UNICORN
     results: set[Requirement] = to_poetry_requirements({"unicorn": {"optional": "true", "version": ">=20.1"}})
     assert len(results) == 1, "one pep508 requirement generated"
     assert expected == str(results.pop()), "unicorn>=20.1.0, optional=true"
 
 
 def test_git_dependency() -> None:
-    expected: str = str(Requirement("check-pyproject@ git+https://github.com:royw/check_pyproject.git"))
+    expected: str = EXP_CHECK_PYPROJECT_GIT
     results: set[Requirement] = to_poetry_requirements(
         {"check-pyproject": {"git": "git@github.com:royw/check_pyproject.git"}}
     )
@@ -183,70 +236,29 @@ def test_caret_requirement_to_pep508() -> None:
     ), "^1.2.3 max_bounds=True"
 
 
-def test_hg_vcs() -> None:
-    dependencies = tomllib.loads("""
-    foo1 = {hg = "https://foohub.com/foo1/foo1.hg"}
-    foo2 = {hg = "https://foohub.com/foo2/foo2.hg", branch = "next"}
-    foo3 = {hg = "https://foohub.com/foo3/foo3.hg", rev = "38eb5d3b"}
-    foo4 = {hg = "https://foohub.com/foo4/foo4.hg", tag = "v0.13.2"}
-    foo5 = {hg = "https://foohub.com/foo5/foo5.hg", subdirectory = "subdir"}
-    """)
-    target_requirements = {
-        Requirement("foo1@ hg+https://foohub.com/foo1/foo1.hg"),
-        Requirement("foo2@ hg+https://foohub.com/foo2/foo2.hg@next"),
-        Requirement("foo3@ hg+https://foohub.com/foo3/foo3.hg@38eb5d3b"),
-        Requirement("foo4@ hg+https://foohub.com/foo4/foo4.hg@v0.13.2"),
-        Requirement("foo5@ hg+https://foohub.com/foo5/foo5.hg/subdir"),
-    }
-    requirements = to_poetry_requirements(dependencies)
-    diff = requirements.symmetric_difference(target_requirements)
-    assert len(diff) == 0, f"Hg Diff: {pformat(diff)}"
-
-
-def test_svn_vcs() -> None:
-    dependencies = tomllib.loads("""
-    foo1 = {svn = "https://foohub.com/foo1/foo1.svn"}
-    foo2 = {svn = "https://foohub.com/foo2/foo2.svn", branch = "next"}
-    foo3 = {svn = "https://foohub.com/foo3/foo3.svn", rev = "38eb5d3b"}
-    foo4 = {svn = "https://foohub.com/foo4/foo4.svn", tag = "v0.13.2"}
-    foo5 = {svn = "https://foohub.com/foo5/foo5.svn", subdirectory = "subdir"}
-    """)
-    target_requirements = {
-        Requirement("foo1@ svn+https://foohub.com/foo1/foo1.svn"),
-        Requirement("foo2@ svn+https://foohub.com/foo2/foo2.svn@next"),
-        Requirement("foo3@ svn+https://foohub.com/foo3/foo3.svn@38eb5d3b"),
-        Requirement("foo4@ svn+https://foohub.com/foo4/foo4.svn@v0.13.2"),
-        Requirement("foo5@ svn+https://foohub.com/foo5/foo5.svn/subdir"),
-    }
-    requirements = to_poetry_requirements(dependencies)
-    diff = requirements.symmetric_difference(target_requirements)
-    assert len(diff) == 0, f"svn Diff: {pformat(diff)}"
-
-
-def test_bzr_vcs() -> None:
-    dependencies = tomllib.loads("""
-    foo1 = {bzr = "https://foohub.com/foo1/foo1.bzr"}
-    foo2 = {bzr = "https://foohub.com/foo2/foo2.bzr", branch = "next"}
-    foo3 = {bzr = "https://foohub.com/foo3/foo3.bzr", rev = "38eb5d3b"}
-    foo4 = {bzr = "https://foohub.com/foo4/foo4.bzr", tag = "v0.13.2"}
-    foo5 = {bzr = "https://foohub.com/foo5/foo5.bzr", subdirectory = "subdir"}
-    """)
-    target_requirements = {
-        Requirement("foo1@ bzr+https://foohub.com/foo1/foo1.bzr"),
-        Requirement("foo2@ bzr+https://foohub.com/foo2/foo2.bzr@next"),
-        Requirement("foo3@ bzr+https://foohub.com/foo3/foo3.bzr@38eb5d3b"),
-        Requirement("foo4@ bzr+https://foohub.com/foo4/foo4.bzr@v0.13.2"),
-        Requirement("foo5@ bzr+https://foohub.com/foo5/foo5.bzr/subdir"),
-    }
-    requirements = to_poetry_requirements(dependencies)
-    diff = requirements.symmetric_difference(target_requirements)
-    assert len(diff) == 0, f"bzr Diff: {pformat(diff)}"
+@pytest.mark.parametrize(
+    ("specification", "max_bounds"),
+    [("^2.0rc1", True), ("~1.2+local", True), ("^foo", False)],
+)
+def test_convert_invalid_specifier(specification: str, max_bounds: bool) -> None:
+    with pytest.raises(InvalidSpecifier):
+        convert_poetry_specifier_to_pep508(specification, max_bounds=max_bounds)
+
+
+@pytest.mark.parametrize("vcs", ["hg", "svn", "bzr"])
+def test_vcs(vcs: str) -> None:
+    requirements = to_poetry_requirements(VCS_DEPENDENCIES[vcs])
+    diff = requirements.symmetric_difference(VCS_TARGET_REQUIREMENTS[vcs])
+    assert len(diff) == 0, f"{vcs} Diff: {pformat(diff)}"
+
+
+# requirement sets for test_format_diff_values_set, parsed once
+PROJECT_REQS: frozenset[Requirement] = frozenset(Requirement(f"1.2.{n}") for n in range(10))
+POETRY_REQS: frozenset[Requirement] = frozenset(Requirement(f"1.2.{2 * n}") for n in range(10))
 
 
 def test_format_diff_values_set() -> None:
-    project_data = {Requirement(f"1.2.{n}") for n in range(10)}
-    poetry_data = {Requirement(f"1.2.{2 * n}") for n in range(10)}
-    out_str = format_diff_values(project_data=project_data, poetry_data=poetry_data)
+    out_str = format_diff_values(project_data=set(PROJECT_REQS), poetry_data=set(POETRY_REQS))
     assert out_str == (
         'project: ["1.2.1", "1.2.3", "1.2.5", "1.2.7", "1.2.9"]\n'
         "vs\n"
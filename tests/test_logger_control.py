@@ -0,0 +1,43 @@
+# SPDX-FileCopyrightText: 2024 Roy Wright
+#
+# SPDX-License-Identifier: MIT
+
+"""default tests for logger_control.py"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+from check_pyproject.clibones.logger_control import BufferedFileSink
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_buffered_file_sink(tmp_path: Path) -> None:
+    logfile = tmp_path / "test_buffered.log"
+    sink = BufferedFileSink(logfile)
+    handler_id = logger.add(sink, level="DEBUG", format="{message}")
+    try:
+        # INFO stays in the buffer until sync()
+        logger.info("buffered info")
+        assert logfile.read_text(encoding="utf-8") == ""
+        sink.sync()
+        assert "buffered info" in logfile.read_text(encoding="utf-8")
+
+        # ERROR reaches the file immediately
+        logger.error("immediate error")
+        assert "immediate error" in logfile.read_text(encoding="utf-8")
+    finally:
+        logger.remove(handler_id)
+
+
+def test_buffered_file_sink_stop(tmp_path: Path) -> None:
+    logfile = tmp_path / "test_stop.log"
+    handler_id = logger.add(BufferedFileSink(logfile), level="DEBUG", format="{message}")
+    logger.info("flushed on remove")
+    # removing the handler stops the sink, flushing and closing the file
+    logger.remove(handler_id)
+    assert "flushed on remove" in logfile.read_text(encoding="utf-8")
@@ -13,24 +13,46 @@ from typing import Any
 import pytest
 import tomlkit
 from _pytest.capture import CaptureFixture
+from loguru import logger
 
 from check_pyproject.__main__ import main
 
 tests_dir = Path(__file__).parent
 
+# command line arguments for the fixture files, resolved once
+GOOD_PYPROJECT = str(tests_dir / "good_pyproject.toml")
+BAD_PYPROJECT = str(tests_dir / "bad_pyproject.toml")
+CONFIG_1 = str(tests_dir / "config_1.toml")
+CONFIG_2 = str(tests_dir / "config_2.toml")
+CONFIG_3 = str(tests_dir / "config_3.toml")
+CONFIG_4 = str(tests_dir / "config_4.toml")
+
+# the installed package version, looked up once
+PKG_VERSION = version("check_pyproject")
+
 
 def test_main_pyproject() -> None:
-    assert main([str(Path(__file__).parent / "good_pyproject.toml")]) == 0
+    assert main([GOOD_PYPROJECT]) == 0
 
 
 def test_main_bad_pyproject() -> None:
-    assert main([str(Path(__file__).parent / "bad_pyproject.toml")]) != 0
+    assert main([BAD_PYPROJECT]) != 0
 
 
 def test_main_version(capsys: CaptureFixture[Any]) -> None:
     assert main(["--version"]) == 0
     captured = capsys.readouterr()
-    assert version("check_pyproject") in captured.out
+    assert PKG_VERSION in captured.out
+
+
+def test_main_after_logger_remove(capsys: CaptureFixture[Any]) -> None:
+    # the sinks must be re-added even when the logger was reconfigured behind main's back
+    assert main(["--version"]) == 0
+    capsys.readouterr()
+    logger.remove()
+    assert main(["--version"]) == 0
+    captured = capsys.readouterr()
+    assert PKG_VERSION in captured.out
 
 
 def test_main_longhelp() -> None:
@@ -49,14 +71,14 @@ def test_main_help(capsys: CaptureFixture[Any]) -> None:
 
 
 def test_quiet(capsys: CaptureFixture[Any]) -> None:
-    assert main(["--quiet", "--config", str(tests_dir / "config_2.toml"), str(tests_dir / "good_pyproject.toml")]) == 0
+    assert main(["--quiet", "--config", CONFIG_2, GOOD_PYPROJECT]) == 0
     captured = capsys.readouterr()
     assert captured.out == ""
 
 
 def test_invalid_loglevel(capsys: CaptureFixture[Any]) -> None:
     with pytest.raises(SystemExit):
-        main(["--loglevel", "1", "--config", str(tests_dir / "config_2.toml"), str(tests_dir / "good_pyproject.toml")])
+        main(["--loglevel", "1", "--config", CONFIG_2, GOOD_PYPROJECT])
     captured = capsys.readouterr()
     assert "error: argument --loglevel:" in captured.err
 
@@ -70,58 +92,66 @@ def test_logfile() -> None:
         assert filepath.stat().st_size > 0
 
 
+def test_logfile_missing_directories() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        filepath = Path(tmp) / "sub" / "dir" / "test_logfile.log"
+        assert main(["--longhelp", "--logfile", str(filepath)]) == 0
+        assert filepath.is_file()
+        assert filepath.stat().st_size > 0
+
+
 def test_load_config_file_debug(capsys: CaptureFixture[Any]) -> None:
     # with debug=true
-    assert main(["--config", str(tests_dir / "config_1.toml"), str(tests_dir / "good_pyproject.toml")]) == 0
+    assert main(["--config", CONFIG_1, GOOD_PYPROJECT]) == 0
     captured = capsys.readouterr()
     assert "project_requirements" in captured.out
 
 
 def test_load_config_file_not_debug(capsys: CaptureFixture[Any]) -> None:
     # with debug=false
-    assert main(["--config", str(tests_dir / "config_2.toml"), str(tests_dir / "good_pyproject.toml")]) == 0
+    assert main(["--config", CONFIG_2, GOOD_PYPROJECT]) == 0
     captured = capsys.readouterr()
     assert "project_requirements" not in captured.out
 
 
 def test_load_config_file_loglevel_debug(capsys: CaptureFixture[Any]) -> None:
     # with loglevel=DEBUG
-    assert main(["--config", str(tests_dir / "config_3.toml"), str(tests_dir / "good_pyproject.toml")]) == 0
+    assert main(["--config", CONFIG_3, GOOD_PYPROJECT]) == 0
     captured = capsys.readouterr()
     assert "project_requirements" in captured.out
 
 
 def test_load_config_file_loglevel_info(capsys: CaptureFixture[Any]) -> None:
     # with loglevel=INFO
-    assert main(["--config", str(tests_dir / "config_4.toml"), str(tests_dir / "good_pyproject.toml")]) == 0
+    assert main(["--config", CONFIG_4, GOOD_PYPROJECT]) == 0
     captured = capsys.readouterr()
     assert "project_requirements" not in captured.out
 
 
 def test_debug_flags(capsys: CaptureFixture[Any]) -> None:
     # with debug=true
-    assert main(["--debug", str(tests_dir / "good_pyproject.toml")]) == 0
+    assert main(["--debug", GOOD_PYPROJECT]) == 0
     captured = capsys.readouterr()
     assert "project_requirements" in captured.out
 
 
 def test_debug_flags_false(capsys: CaptureFixture[Any]) -> None:
     # with debug=false
-    assert main([str(tests_dir / "good_pyproject.toml")]) == 0
+    assert main([GOOD_PYPROJECT]) == 0
     captured = capsys.readouterr()
     assert "project_requirements" not in captured.out
 
 
 def test_debug_flags_debug(capsys: CaptureFixture[Any]) -> None:
     # with --loglevel DEBUG
-    assert main(["--loglevel", "DEBUG", str(tests_dir / "good_pyproject.toml")]) == 0
+    assert main(["--loglevel", "DEBUG", GOOD_PYPROJECT]) == 0
     captured = capsys.readouterr()
     assert "project_requirements" in captured.out
 
 
 def test_debug_flags_info(capsys: CaptureFixture[Any]) -> None:
     # with --loglevel INFO
-    assert main(["--loglevel", "INFO", str(tests_dir / "good_pyproject.toml")]) == 0
+    assert main(["--loglevel", "INFO", GOOD_PYPROJECT]) == 0
     captured = capsys.readouterr()
     assert "project_requirements" not in captured.out
 
@@ -138,7 +168,7 @@ def test_save_config_file_as() -> None:
                 "DEBUG",
                 "--save-config-as",
                 str(test_save_config_filepath),
-                str(tests_dir / "good_pyproject.toml"),
+                GOOD_PYPROJECT,
             ]
         )
         == 0
@@ -180,7 +210,7 @@ def test_save_config_file() -> None:
                 "--save-config",
                 "--loglevel",
                 "ERROR",
-                str(tests_dir / "good_pyproject.toml"),
+                GOOD_PYPROJECT,
             ]
         )
         == 0
@@ -25,11 +25,13 @@ should have been generated from the current pyproject.toml file.
 Thus, let's be sure this pythonisque SNAFU is actually working...
 """
 
+# the project's pyproject.toml, in the parent directory of the tests directory
+pyproject_path = Path(__file__).parent.parent / "pyproject.toml"
+
 
 @contextlib.contextmanager
 def pyproject() -> Generator[dict[str, Any], None, None]:
-    path = Path(__file__).parent.parent / "pyproject.toml"
-    with path.open() as fp:
+    with pyproject_path.open() as fp:
         yield tomlkit.loads(fp.read()).value
 
 